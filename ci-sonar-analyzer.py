@@ -9,24 +9,77 @@ import requests
 import json
 import sys
 import argparse
+import functools
+import math
+import re
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Optional: faster JSON parsing/encoding when installed
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+ISSUES_PAGE_SIZE = 500
+ISSUES_SEARCH_LIMIT = 10000  # SonarQube refuses to page past 10k results per query
+ISSUE_PAGE_WORKERS = 8
+SEVERITIES = ["BLOCKER", "CRITICAL", "MAJOR", "MINOR", "INFO"]
+DETAIL_LEVELS = ["summary", "full"]
+CRITICAL_ISSUES_SHOWN = 5  # Critical issues listed in summary reports
+CRITICAL_SEVERITIES = frozenset(["BLOCKER", "CRITICAL"])
+TYPE_CATEGORIES = {"BUG": "RELIABILITY", "VULNERABILITY": "SECURITY", "CODE_SMELL": "MAINTAINABILITY"}
+
+# Rule/message patterns for categorizing issues of unmapped types
+SECURITY_PATTERN = re.compile(r"hardcoded|password|secret|credential|token|key", re.IGNORECASE)
+RELIABILITY_PATTERN = re.compile(r"null|npe|exception|crash|fail", re.IGNORECASE)
+
+ApiGetter = Callable[["SonarQubeCIAnalyzer"], Optional[Dict[str, Any]]]
+
+def _memoize(method: ApiGetter) -> ApiGetter:
+    """Cache a successful API getter result on the analyzer instance"""
+    @functools.wraps(method)
+    def wrapper(self: "SonarQubeCIAnalyzer") -> Optional[Dict[str, Any]]:
+        if method.__name__ not in self._cache:
+            result = method(self)
+            if result is None:
+                return None  # Don't cache failures so a later call can retry
+            self._cache[method.__name__] = result
+        return self._cache[method.__name__]
+    return wrapper
 
 class SonarQubeCIAnalyzer:
-    def __init__(self, server_url: str, token: str, project_key: str):
+    def __init__(self, server_url: str, token: str, project_key: str) -> None:
         self.server_url = server_url.rstrip('/')
         self.token = token
         self.project_key = project_key
         self.headers = {"Authorization": f"Bearer {token}"}
+        self._dashboard_url = f"{self.server_url}/dashboard?id={self.project_key}"
+        # Shared session so concurrent API calls reuse pooled keep-alive connections
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+        # Room for every page worker plus the metrics and quality gate calls running alongside
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=ISSUE_PAGE_WORKERS + 2, max_retries=retries)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # Fetched API payloads and the last analysis, shared by summary and exit code
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._last_analysis: Optional[Dict[str, Any]] = None
     
-    def make_request(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
+    def make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """Make authenticated request to SonarQube API"""
         url = f"{self.server_url}/api/{endpoint}"
         try:
-            response = requests.get(url, headers=self.headers, params=params or {}, timeout=30)
+            response = self._session.get(url, params=params or {}, timeout=30)
             if response.status_code == 200:
-                return response.json()
+                data: Dict[str, Any] = orjson.loads(response.content) if orjson else response.json()
+                return data
             else:
                 print(f"❌ API Error {response.status_code}: {response.text}", file=sys.stderr)
                 return None
@@ -34,7 +87,14 @@ class SonarQubeCIAnalyzer:
             print(f"❌ Request failed: {e}", file=sys.stderr)
             return None
 
-    def get_project_metrics(self) -> Dict:
+    def _gather(self, *calls: Callable[[], Optional[Dict[str, Any]]]) -> List[Optional[Dict[str, Any]]]:
+        """Run independent API calls concurrently and return results in call order"""
+        with ThreadPoolExecutor(max_workers=max(len(calls), 1)) as executor:
+            futures = [executor.submit(call) for call in calls]
+            return [future.result() for future in futures]
+
+    @_memoize
+    def get_project_metrics(self) -> Optional[Dict[str, Any]]:
         """Get project quality metrics"""
         params = {
             "component": self.project_key,
@@ -42,104 +102,191 @@ class SonarQubeCIAnalyzer:
         }
         return self.make_request("measures/component", params)
 
-    def get_issues(self) -> Dict:
-        """Get all project issues"""
+    def _get_issues_page(self, page: int, severities: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Get a single page of unresolved project issues"""
         params = {
             "componentKeys": self.project_key,
-            "ps": "500",
+            "ps": str(ISSUES_PAGE_SIZE),
+            "p": str(page),
             "resolved": "false"
         }
+        if severities:
+            params["severities"] = severities
         return self.make_request("issues/search", params)
 
-    def get_quality_gate_status(self) -> Dict:
+    def _get_paging(self, page_data: Dict[str, Any]) -> Tuple[int, int]:
+        """Extract (total, page size) from an issues/search response"""
+        paging = page_data.get("paging", {})
+        total = paging.get("total", page_data.get("total", 0))
+        page_size = paging.get("pageSize", page_data.get("ps", ISSUES_PAGE_SIZE))
+        return int(total), int(page_size) or ISSUES_PAGE_SIZE
+
+    def _collect_issues(self, first_page: Dict[str, Any], severities: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """Fetch the remaining pages of a query concurrently and concatenate issues"""
+        total, page_size = self._get_paging(first_page)
+        if total > ISSUES_SEARCH_LIMIT:
+            query = f"{severities} issues" if severities else "issues"
+            print(f"⚠️  Only the first {ISSUES_SEARCH_LIMIT} of {total} {query} can be retrieved", file=sys.stderr)
+        n_pages = math.ceil(min(total, ISSUES_SEARCH_LIMIT) / page_size)
+        issues = list(first_page.get("issues", []))
+        if n_pages > 1:
+            with ThreadPoolExecutor(max_workers=ISSUE_PAGE_WORKERS) as executor:
+                pages = executor.map(lambda page: self._get_issues_page(page, severities), range(2, n_pages + 1))
+                for page, page_data in enumerate(pages, 2):
+                    if page_data is None:
+                        # A missing page would hide issues from the CI decision
+                        print(f"❌ Failed to retrieve issues page {page} of {n_pages}", file=sys.stderr)
+                        return None
+                    issues.extend(page_data.get("issues", []))
+        return issues
+
+    @_memoize
+    def get_issues(self) -> Optional[Dict[str, Any]]:
+        """Get all project issues"""
+        first_page = self._get_issues_page(1)
+        if not first_page:
+            return None
+
+        total, _ = self._get_paging(first_page)
+        if total > ISSUES_SEARCH_LIMIT:
+            # Split the query by severity to stay under the search limit
+            severity_pages = self._gather(
+                *(functools.partial(self._get_issues_page, 1, severity) for severity in SEVERITIES)
+            )
+            issues: List[Dict[str, Any]] = []
+            for severity, severity_page in zip(SEVERITIES, severity_pages):
+                severity_issues = self._collect_issues(severity_page, severity) if severity_page else None
+                if severity_issues is None:
+                    print(f"❌ Failed to retrieve {severity} issues", file=sys.stderr)
+                    return None
+                issues.extend(severity_issues)
+        else:
+            collected = self._collect_issues(first_page)
+            if collected is None:
+                return None
+            issues = collected
+
+        # Paging describes the combined result, which may be capped below the server total
+        issues_data = dict(first_page)
+        issues_data["issues"] = issues
+        issues_data["total"] = len(issues)
+        issues_data["paging"] = {"pageIndex": 1, "pageSize": len(issues), "total": len(issues)}
+        return issues_data
+
+    @_memoize
+    def get_quality_gate_status(self) -> Optional[Dict[str, Any]]:
         """Get quality gate status"""
         params = {"projectKey": self.project_key}
         return self.make_request("qualitygates/project_status", params)
 
-    def analyze_issues(self, issues_data: Dict) -> Dict:
+    def analyze_issues(self, issues_data: Optional[Dict[str, Any]], include_details: bool = True,
+                       critical_limit: Optional[int] = None) -> Dict[str, Any]:
         """Analyze and categorize issues"""
+        # include_details adds per-category issue lists; critical_limit caps how many
+        # critical issues are listed (critical_count always holds the full number)
         if not issues_data:
             return {}
         
         issues = issues_data.get("issues", [])
         
-        analysis = {
+        analysis: Dict[str, Any] = {
             "total": len(issues),
-            "by_severity": {"BLOCKER": 0, "CRITICAL": 0, "MAJOR": 0, "MINOR": 0, "INFO": 0},
+            "by_severity": {severity: 0 for severity in SEVERITIES},
             "by_type": {"BUG": 0, "VULNERABILITY": 0, "CODE_SMELL": 0},
-            "by_category": {"RELIABILITY": 0, "SECURITY": 0, "MAINTAINABILITY": 0},
-            "category_details": {
+            "by_category": {"RELIABILITY": 0, "SECURITY": 0, "MAINTAINABILITY": 0}
+        }
+        if include_details:
+            analysis["category_details"] = {
                 "RELIABILITY": [],
                 "SECURITY": [], 
                 "MAINTAINABILITY": []
-            },
-            "critical_issues": [],
-            "new_issues": 0
-        }
+            }
+        analysis["critical_issues"] = []
+        analysis["new_issues"] = 0
+        analysis["critical_count"] = 0
         
-        for issue in issues:
-            severity = issue.get("severity", "UNKNOWN")
-            issue_type = issue.get("type", "UNKNOWN")
-            rule_key = issue.get("rule", "")
-            message = issue.get("message", "")
-            
-            analysis["by_severity"][severity] = analysis["by_severity"].get(severity, 0) + 1
-            analysis["by_type"][issue_type] = analysis["by_type"].get(issue_type, 0) + 1
-            
-            # Categorize by quality dimension
-            category = self._get_issue_category(issue_type, rule_key, message)
-            analysis["by_category"][category] = analysis["by_category"].get(category, 0) + 1
+        severities = [issue.get("severity", "UNKNOWN") for issue in issues]
+        types = [issue.get("type", "UNKNOWN") for issue in issues]
+        # Categorize by quality dimension
+        categories = [
+            self._get_issue_category(issue_type, issue.get("rule", ""), issue.get("message", ""))
+            for issue, issue_type in zip(issues, types)
+        ]
+        
+        # Count in bulk; fixed keys keep their order, unexpected values are appended
+        severity_counts = Counter(severities)
+        analysis["by_severity"].update(severity_counts)
+        analysis["by_type"].update(Counter(types))
+        analysis["by_category"].update(Counter(categories))
+        analysis["new_issues"] = sum(1 for issue in issues if issue.get("isNew", False))
+        analysis["critical_count"] = sum(severity_counts[severity] for severity in CRITICAL_SEVERITIES)
+        
+        category_details = analysis.get("category_details")
+        critical_issues = analysis["critical_issues"]
+        
+        for issue, severity, category in zip(issues, severities, categories):
+            is_listed_critical = severity in CRITICAL_SEVERITIES and (
+                critical_limit is None or len(critical_issues) < critical_limit
+            )
+            if category_details is None and not is_listed_critical:
+                continue
+            filename = issue.get("component", "").split(":")[-1]
             
             # Store issue details for reporting
-            issue_detail = {
-                "rule": rule_key,
-                "message": message,
-                "severity": severity,
-                "component": issue.get("component", "").split(":")[-1],  # Get filename
-                "line": issue.get("line", "N/A")
-            }
-            analysis["category_details"][category].append(issue_detail)
+            if category_details is not None:
+                category_details[category].append({
+                    "rule": issue.get("rule", ""),
+                    "message": issue.get("message", ""),
+                    "severity": severity,
+                    "component": filename,
+                    "line": issue.get("line", "N/A")
+                })
             
             # Track critical issues for CI decisions
-            if severity in ["BLOCKER", "CRITICAL"]:
-                analysis["critical_issues"].append({
+            if is_listed_critical:
+                critical_issues.append({
                     "rule": issue.get("rule"),
                     "severity": severity,
                     "message": issue.get("message"),
-                    "file": issue.get("component", "").split(":")[-1],
+                    "file": filename,
                     "line": issue.get("line")
                 })
-            
-            # Count new issues (if available)
-            if issue.get("isNew", False):
-                analysis["new_issues"] += 1
         
         return analysis
 
-    def generate_ci_summary(self, format_type: str = "text") -> str:
+    def generate_ci_summary(self, format_type: str = "text", detail_level: str = "summary") -> str:
         """Generate CI-friendly summary report"""
         print("🔍 Fetching SonarQube analysis data...", file=sys.stderr)
         
-        # Gather data
-        metrics_data = self.get_project_metrics()
-        issues_data = self.get_issues()
-        quality_gate = self.get_quality_gate_status()
+        # Gather data (endpoints are independent, so fetch them concurrently)
+        metrics_data, issues_data, quality_gate = self._gather(
+            self.get_project_metrics, self.get_issues, self.get_quality_gate_status
+        )
         
         if not issues_data:
             return "❌ Failed to retrieve analysis data"
         
-        issue_analysis = self.analyze_issues(issues_data)
+        # Per-issue lists are only emitted by the full JSON report
+        full_details = format_type == "json" and detail_level == "full"
+        issue_analysis = self.analyze_issues(
+            issues_data,
+            include_details=full_details,
+            critical_limit=None if full_details else CRITICAL_ISSUES_SHOWN
+        )
+        self._last_analysis = issue_analysis
         
+        now = datetime.now()
         if format_type == "json":
-            return self._generate_json_summary(metrics_data, issue_analysis, quality_gate)
+            return self._generate_json_summary(metrics_data, issue_analysis, quality_gate, now)
         elif format_type == "markdown":
             return self._generate_markdown_summary(metrics_data, issue_analysis, quality_gate)
         else:
-            return self._generate_text_summary(metrics_data, issue_analysis, quality_gate)
+            return self._generate_text_summary(metrics_data, issue_analysis, quality_gate, now)
 
-    def _generate_text_summary(self, metrics_data: Dict, issue_analysis: Dict, quality_gate: Dict) -> str:
+    def _generate_text_summary(self, metrics_data: Optional[Dict[str, Any]], issue_analysis: Dict[str, Any], quality_gate: Optional[Dict[str, Any]],
+                               now: datetime) -> str:
         """Generate plain text summary for CI logs"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
         
         # Extract metrics
         measures = {}
@@ -153,7 +300,7 @@ class SonarQubeCIAnalyzer:
             qg_status = quality_gate["projectStatus"].get("status", "UNKNOWN")
         
         # Generate summary
-        summary = f"""
+        parts = [f"""
 ════════════════════════════════════════════════════════════════
                     SONARQUBE CI ANALYSIS SUMMARY
 ════════════════════════════════════════════════════════════════
@@ -187,39 +334,43 @@ class SonarQubeCIAnalyzer:
     ├── 🐛 BUGS: {issue_analysis['by_type'].get('BUG', 0)}
     ├── 🔒 VULNERABILITIES: {issue_analysis['by_type'].get('VULNERABILITY', 0)}
     └── 💨 CODE SMELLS: {issue_analysis['by_type'].get('CODE_SMELL', 0)}
-"""
+"""]
 
         # Add critical issues if any
         critical_issues = issue_analysis.get('critical_issues', [])
         if critical_issues:
-            summary += "\n⚠️  CRITICAL ISSUES (BLOCKING):\n"
-            for i, issue in enumerate(critical_issues[:5], 1):  # Show max 5
-                summary += f"  {i}. [{issue['severity']}] {issue['file']}:{issue.get('line', '?')}\n"
-                summary += f"     {issue['message']}\n"
+            parts.append("\n⚠️  CRITICAL ISSUES (BLOCKING):\n")
+            parts.extend(
+                f"  {i}. [{issue['severity']}] {issue['file']}:{issue.get('line', '?')}\n"
+                f"     {issue['message']}\n"
+                for i, issue in enumerate(critical_issues[:CRITICAL_ISSUES_SHOWN], 1)
+            )
             
-            if len(critical_issues) > 5:
-                summary += f"     ... and {len(critical_issues) - 5} more critical issues\n"
+            critical_total = issue_analysis.get('critical_count', len(critical_issues))
+            if critical_total > CRITICAL_ISSUES_SHOWN:
+                parts.append(f"     ... and {critical_total - CRITICAL_ISSUES_SHOWN} more critical issues\n")
 
         # CI Decision
-        summary += "\n🎯 CI/CD DECISION:\n"
+        parts.append("\n🎯 CI/CD DECISION:\n")
         blocker_count = issue_analysis['by_severity'].get('BLOCKER', 0)
         critical_count = issue_analysis['by_severity'].get('CRITICAL', 0)
         
         if qg_status != 'OK':
-            summary += "❌ FAIL - Quality Gate failed\n"
+            parts.append("❌ FAIL - Quality Gate failed\n")
         elif blocker_count > 0:
-            summary += f"❌ FAIL - {blocker_count} BLOCKER issue(s) found\n"
+            parts.append(f"❌ FAIL - {blocker_count} BLOCKER issue(s) found\n")
         elif critical_count > 0:
-            summary += f"⚠️  WARNING - {critical_count} CRITICAL issue(s) found\n"
+            parts.append(f"⚠️  WARNING - {critical_count} CRITICAL issue(s) found\n")
         else:
-            summary += "✅ PASS - No blocking issues found\n"
+            parts.append("✅ PASS - No blocking issues found\n")
 
-        summary += f"\n🌐 Dashboard: {self.server_url}/dashboard?id={self.project_key}"
-        summary += "\n" + "═" * 64
+        parts.append(f"\n🌐 Dashboard: {self._dashboard_url}")
+        parts.append("\n" + "═" * 64)
 
-        return summary
+        return "".join(parts)
 
-    def _generate_json_summary(self, metrics_data: Dict, issue_analysis: Dict, quality_gate: Dict) -> str:
+    def _generate_json_summary(self, metrics_data: Optional[Dict[str, Any]], issue_analysis: Dict[str, Any], quality_gate: Optional[Dict[str, Any]],
+                               now: datetime) -> str:
         """Generate JSON summary for programmatic use"""
         measures = {}
         if metrics_data and "component" in metrics_data:
@@ -231,7 +382,7 @@ class SonarQubeCIAnalyzer:
             qg_status = quality_gate["projectStatus"].get("status", "UNKNOWN")
 
         summary = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "project": self.project_key,
             "quality_gate": {
                 "status": qg_status,
@@ -244,12 +395,15 @@ class SonarQubeCIAnalyzer:
                 "has_warnings": issue_analysis['by_severity'].get('CRITICAL', 0) > 0,
                 "is_passing": qg_status == "OK" and issue_analysis['by_severity'].get('BLOCKER', 0) == 0
             },
-            "dashboard_url": f"{self.server_url}/dashboard?id={self.project_key}"
+            "dashboard_url": self._dashboard_url
         }
         
-        return json.dumps(summary, indent=2)
+        if orjson:
+            encoded: bytes = orjson.dumps(summary, option=orjson.OPT_INDENT_2)
+            return encoded.decode("utf-8")
+        return json.dumps(summary, indent=2, ensure_ascii=False)
 
-    def _generate_markdown_summary(self, metrics_data: Dict, issue_analysis: Dict, quality_gate: Dict) -> str:
+    def _generate_markdown_summary(self, metrics_data: Optional[Dict[str, Any]], issue_analysis: Dict[str, Any], quality_gate: Optional[Dict[str, Any]]) -> str:
         """Generate Markdown summary for GitHub/GitLab comments"""
         measures = {}
         if metrics_data and "component" in metrics_data:
@@ -287,38 +441,29 @@ class SonarQubeCIAnalyzer:
 
 **Total Issues:** {issue_analysis.get('total', 0)} | **New Issues:** {issue_analysis.get('new_issues', 0)}
 
-[📊 View Full Report]({self.server_url}/dashboard?id={self.project_key})
+[📊 View Full Report]({self._dashboard_url})
 """
         return summary
 
     def _get_issue_category(self, issue_type: str, rule_key: str, message: str) -> str:
         """Categorize issues by quality dimension"""
         # Direct mapping by issue type
-        if issue_type == "BUG":
-            return "RELIABILITY"
-        elif issue_type == "VULNERABILITY":
-            return "SECURITY"
-        elif issue_type == "CODE_SMELL":
-            return "MAINTAINABILITY"
+        if issue_type in TYPE_CATEGORIES:
+            return TYPE_CATEGORIES[issue_type]
         
         # Additional categorization by rule patterns for edge cases
-        rule_lower = rule_key.lower()
-        message_lower = message.lower()
-        
         # Security-related patterns
-        security_patterns = ["hardcoded", "password", "secret", "credential", "token", "key"]
-        if any(pattern in rule_lower or pattern in message_lower for pattern in security_patterns):
+        if SECURITY_PATTERN.search(rule_key) or SECURITY_PATTERN.search(message):
             return "SECURITY"
         
         # Reliability patterns (bugs, null pointers, exceptions)
-        reliability_patterns = ["null", "npe", "exception", "crash", "fail"]
-        if any(pattern in rule_lower or pattern in message_lower for pattern in reliability_patterns):
+        if RELIABILITY_PATTERN.search(rule_key) or RELIABILITY_PATTERN.search(message):
             return "RELIABILITY"
         
         # Default to maintainability for code smells
         return "MAINTAINABILITY"
 
-    def _format_rating(self, rating: str) -> str:
+    def _format_rating(self, rating: Optional[str]) -> str:
         """Format quality rating with emoji"""
         if not rating:
             return "N/A"
@@ -327,8 +472,7 @@ class SonarQubeCIAnalyzer:
 
     def get_exit_code(self) -> int:
         """Get appropriate exit code for CI/CD"""
-        quality_gate = self.get_quality_gate_status()
-        issues_data = self.get_issues()
+        quality_gate, issues_data = self._gather(self.get_quality_gate_status, self.get_issues)
         
         if not quality_gate or not issues_data:
             return 2  # Error in analysis
@@ -337,7 +481,7 @@ class SonarQubeCIAnalyzer:
         if qg_status != "OK":
             return 1  # Quality gate failed
         
-        issue_analysis = self.analyze_issues(issues_data)
+        issue_analysis = self._last_analysis or self.analyze_issues(issues_data)
         blocker_count = issue_analysis['by_severity'].get('BLOCKER', 0)
         
         if blocker_count > 0:
@@ -345,12 +489,15 @@ class SonarQubeCIAnalyzer:
         
         return 0  # Success
 
-def main():
+def main() -> None:
     parser = argparse.ArgumentParser(description="SonarQube CI/CD Analysis Summary Generator")
     parser.add_argument("--server-url", default="http://localhost:9999", help="SonarQube server URL")
     parser.add_argument("--token", required=True, help="SonarQube authentication token")
     parser.add_argument("--project-key", required=True, help="SonarQube project key")
     parser.add_argument("--format", choices=["text", "json", "markdown"], default="text", help="Output format")
+    parser.add_argument("--detail-level", choices=DETAIL_LEVELS, default="summary",
+                        help="JSON detail: counts plus the first 5 critical issues (summary, default; omits "
+                             "category_details) or every critical issue and category_details (full, the previous fields plus critical_count)")
     parser.add_argument("--output", help="Output file (default: stdout)")
     parser.add_argument("--exit-code", action="store_true", help="Set exit code based on analysis results")
     parser.add_argument("--wait-for-analysis", type=int, default=0, help="Wait N seconds for analysis to complete")
@@ -364,11 +511,11 @@ def main():
     
     # Generate summary
     analyzer = SonarQubeCIAnalyzer(args.server_url, args.token, args.project_key)
-    summary = analyzer.generate_ci_summary(args.format)
+    summary = analyzer.generate_ci_summary(args.format, args.detail_level)
     
     # Output
     if args.output:
-        with open(args.output, 'w') as f:
+        with open(args.output, 'w', encoding='utf-8') as f:
             f.write(summary)
         print(f"✅ Summary written to {args.output}", file=sys.stderr)
     else: